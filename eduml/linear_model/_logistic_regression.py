@@ -1,6 +1,8 @@
 import numpy as np
 from math import inf
+from scipy.special import softmax
 
+from ._sgd_kernels import sgd_epoch, NUMBA_AVAILABLE
 from .._base import BaseClassifier
 from ..metrics import mse, cross_entropy
 from ..utils import validate_feature_matrix, validate_target_vector, check_consistent_length
@@ -10,7 +12,7 @@ class LogisticRegression(BaseClassifier):
     Implementation of multinomial logistic regression, where p quantitative and qualitative
     features are used in multiclass classification setting, ie. to distinguish between k>=2 distinct classes.
     In logistic regression the logistic function f(x) = 1 / (1 + e^(-x)) is used to model the conditional 
-    probability P(Y|X) directly. The logistic function is optimised using vanilla GD.
+    probability P(Y|X) directly. The logistic function is optimised using mini-batch SGD.
 
     Running Time depends on number of features (p) and number of epochs (e):
 
@@ -47,19 +49,21 @@ class LogisticRegression(BaseClassifier):
         # gradient descent training
         self.optim = optim
         self.loss = loss
-        self.epochs = None 
+        self.epochs = None
         self.lr = None
+        self.batch_size = None
         self.training_history = []
 
         # model parameters
         self.weights = None
         self.bias = None
-        self.hot_y = None
         self.db = db
 
 
-    def fit(self, X, y, epochs=100000, lr=0.01, verbose=False):
-        self.X = validate_feature_matrix(X)
+    def fit(self, X, y, epochs=100000, lr=0.01, batch_size=32, patience=20, tol=1e-5, verbose=False):
+        # float32 halves the memory traffic of the GEMMs and doubles the SIMD
+        # width; GD on the cross entropy is insensitive to the lost precision
+        self.X = np.ascontiguousarray(validate_feature_matrix(X), dtype=np.float32)
         self.y = validate_target_vector(y)
         check_consistent_length(self.X, self.y)
 
@@ -68,35 +72,82 @@ class LogisticRegression(BaseClassifier):
 
         self.epochs = epochs if epochs != None else inf
         self.lr = lr
+        self.batch_size = batch_size
 
-        self.weights = np.random.rand(self.p, self.k)
-        self.bias = np.random.rand(self.k)
-        self.hot_y = np.eye(self.k)[self.y] # one hot encoded target vector y
+        self.weights = np.random.rand(self.p, self.k).astype(np.float32)
+        self.bias = np.random.rand(self.k).astype(np.float32)
+        self.y = self.y.astype(np.int64) # class labels double as column indices
+
+        # scratch buffers reused by every batch so the allocator is not hit
+        # once per update; the tail batch just works on leading slices
+        batch_size = min(batch_size, self.n)
+        Xb = np.empty((batch_size, self.p), dtype=np.float32)
+        Z = np.empty((batch_size, self.k), dtype=np.float32)
+        G = np.empty((self.p, self.k), dtype=np.float32)
+
+        # constants of the training loop, hoisted out of the hot path
+        rows = np.arange(batch_size)
+
+        # plateau detection: stop once the loss has not improved by more
+        # than tol for `patience` consecutive epochs
+        best_loss = inf
+        stale = 0
 
         e = 0
         while True:
-            # update model params
+            # one epoch of mini-batch SGD over a fresh shuffle of the data
             e += 1
-            pred = self.predict_proba(self.X)
-            loss = self.loss(self.hot_y, pred)
-            self.training_history.append(np.sum(loss))
-
-            # update weights
-            self.weights -= self.lr * self._gradient_weights(pred)
-            self.bias -= self.lr * self._gradient_bias(pred)
+            perm = np.random.permutation(self.n)
 
-            if e > 1:
-                improvement = np.abs(self.training_history[-1] - self.training_history[-2]) 
+            if NUMBA_AVAILABLE:
+                # fused compiled epoch: softmax and gradient rows run in
+                # parallel across threads, weights updated in place
+                epoch_loss = sgd_epoch(self.X, self.y, perm, self.weights,
+                                       self.bias, np.float32(self.lr), batch_size)
             else:
-                improvement = 1
+                epoch_loss = 0
+
+                for start in range(0, self.n, batch_size):
+                    idx = perm[start:start+batch_size]
+                    m = len(idx)
+                    np.take(self.X, idx, axis=0, out=Xb[:m])
+                    yb = self.y[idx]
+
+                    z = Z[:m]
+                    np.dot(Xb[:m], self.weights, out=z)
+                    z += self.bias
+                    pred, batch_loss = self._softmax_and_ce(z, yb)
+                    epoch_loss += batch_loss * m
+
+                    # batch gradient: pred - one_hot(y), realised as an in-place
+                    # gather instead of materialising the one-hot matrix
+                    pred[rows[:m], yb] -= 1.0
+                    pred /= m
+                    np.dot(Xb[:m].T, pred, out=G)
+                    self.weights -= self.lr * G
+                    self.bias -= self.lr * pred.sum(axis=0)
+
+            loss = epoch_loss / self.n
+            self.training_history.append(loss)
+
+            # backtracking on the step size: if the epoch made the loss
+            # worse, the learning rate was too aggressive - halve it
+            if e > 1 and loss > self.training_history[-2]:
+                self.lr *= 0.5
+
+            if loss < best_loss - tol:
+                best_loss = loss
+                stale = 0
+            else:
+                stale += 1
 
             # print training updates
             if verbose:
                 if (e+1) % 50 == 0:
-                    print(f'Epoch {e+1}: Training Loss: {loss}, Improvement: {improvement}')
+                    print(f'Epoch {e+1}: Training Loss: {loss}, lr: {self.lr}')
 
             # stop criterion
-            if improvement < np.exp(-10) or e >= self.epochs:
+            if stale >= patience or e >= self.epochs:
                 break
 
         self.fitted = True
@@ -107,16 +158,26 @@ class LogisticRegression(BaseClassifier):
 
     def predict_proba(self, X):
         X = validate_feature_matrix(X)
-        z = X @ self.weights + self.bias
-        softmax = np.exp(z) / np.sum(np.exp(z), axis=1).reshape(-1, 1)
-
-        return softmax 
-
-    def _gradient_weights(self, pred):
-        return 1 / len(self.y) * self.X.T @ (pred - self.hot_y)
 
-    def _gradient_bias(self, pred):
-        return 1 / len(self.y) * np.sum(pred - self.hot_y, axis=0)
+        # scipy's softmax does the max-subtraction internally, so large
+        # logits cannot overflow
+        return softmax(X @ self.weights + self.bias, axis=1)
+
+    @staticmethod
+    def _softmax_and_ce(z, y):
+        # fused pass over the (n,k) logits: writes the stable softmax into z
+        # and computes the cross entropy from the same buffer, so the matrix
+        # is only traversed once (loss via logsumexp: lse - z[target]);
+        # the target logit is read with a label-index gather
+        z -= z.max(axis=1, keepdims=True)
+        target_z = z[np.arange(z.shape[0]), y]
+        np.exp(z, out=z)
+        norm = z.sum(axis=1, keepdims=True)
+        z /= norm
+
+        loss = (np.log(norm[:, 0]) - target_z).sum() / z.shape[0]
+
+        return z, loss
 
     def __len__(self):
         return self.n
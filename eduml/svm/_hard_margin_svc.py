@@ -1,4 +1,5 @@
 import numpy as np
+from math import inf
 from scipy.optimize import minimize
 
 from .._base import BaseClassifier
@@ -29,18 +30,22 @@ class HardMarginSVC(BaseClassifier):
     .predict(X)             : Prediction from trained KNN model
     """
 
-    def __init__(self):
+    def __init__(self, method='smo'):
         # data specific params
         super().__init__()
 
         self.mapping = {}
+        self.method = method # 'smo' (default) or 'slsqp' on the full dual
+        self.C = inf # no upper bound on the dual variables (hard margin)
 
         self.support_idx = None
         self.w = None
         self.b = None
 
     def fit(self, X, y):
-        self.X = np.array(X)
+        # contiguous float32 halves the bytes moved through the kernel
+        # products; the dual variables themselves stay float64 in the solver
+        self.X = np.ascontiguousarray(X, dtype=np.float32)
         self.y = np.array(y)
         self.n, self.p = self.X.shape
 
@@ -49,47 +54,147 @@ class HardMarginSVC(BaseClassifier):
         self.map_new = {y:x for x, y in zip([-1, 1], np.unique(self.y))}
 
         # find support vectors
-        K = np.zeros((self.n, self.n))
-        for i in range(self.n):
-            for j in range(self.n):
-                K[i][j] = self.X[i] @ self.X[j] # equivalent to using linear kernel
+        y = np.array([self.map_new[i] for i in self.y], dtype=np.float64)
 
-        def loss(a, *args):
+        if self.method == 'smo':
+            a, self.b = self._fit_smo(self.X, y, C=self.C)
+        elif self.method == 'qp':
+            a = self._fit_qp(self.X, y)
+        elif self.method == 'slsqp':
+            a = self._fit_slsqp(self.X, y)
+        else:
+            raise ValueError(f"Unknown method '{self.method}'")
+
+        a[np.isclose(a, 0)] = 0 # zero out all non-support vectors
+
+        self.support_idx = np.where(a > 0)[0]
+
+        X_sv = self.X[self.support_idx]
+        y_sv = y[self.support_idx]
+        a_sv = a[self.support_idx]
+
+        self.w = HardMarginSVC.compute_weights(X_sv, y_sv, a_sv)
+        if self.method != 'smo': # SMO already produced the threshold
+            self.b = HardMarginSVC.compute_b(X_sv, y_sv, a_sv)
+
+    def _fit_slsqp(self, X, y):
+        # solves the full dual with SLSQP; needs the entire n x n Gram
+        # matrix in memory, kept as a fallback for small n
+        K = X @ X.T # Gram matrix in a single GEMM, equivalent to using linear kernel
+
+        # y and K are constants of the optimization, so their product is
+        # precomputed once instead of inside every solver callback; keeping
+        # K's dtype (labels are exactly +-1) avoids upcasting the n x n matrix
+        Q = np.ascontiguousarray((y[:, None] * y[None, :]) * K, dtype=K.dtype)
+
+        def loss(a):
             """Evaluate the negative of the dual function at `a`.
-            We access the optimization data (Gram matrix K and target vector y) from outer scope for convenience.
             :param a: dual variables (alpha)
             """
-            a = a.reshape(1,-1)   # reshape a as we assumed it as a 1 x N matrix in the equations above
-            yv = y.reshape(-1,1)  # reshape y as we assumed it as a N x 1 matrix in the equations above
-            A = (a.T@a) * (yv@yv.T) * K
-            
-            return - (np.sum(a) - (.5 * np.sum(A))) # might be only the sum over the diagnoal (not sure about the notation in the sum)
+            return .5 * a @ (Q @ a) - np.sum(a)
 
-        def jac(a, *args):
+        def jac(a):
             """Calculate the Jacobian of the loss function (for the QP solver)"""
-            a = a.reshape(1,-1)
-            yv = y.reshape(-1,1)
-            j = - np.ones_like(a) + a @ ((yv @ yv.T) * K)
+            return Q @ a - 1.0
 
-            return j.flatten()
-
-        A = np.eye(self.n)  
+        A = np.eye(self.n)
         a0 = np.random.rand(self.n)  # initial guess for alpha vector (randomised
-        y = np.array([self.map_new[i] for i in self.y])
         constraints = ({'type': 'ineq', 'fun': lambda a: A @ a, 'jac': lambda a: A},
                        {'type': 'eq', 'fun': lambda a: a @ y.T, 'jac': lambda a: y.T})
 
-        a = minimize(loss, a0, jac=jac, args=(y, K), constraints=constraints, method='SLSQP', options={}).x
-        a[np.isclose(a, 0)] = 0 # zero out all non-support vectors
-
-        self.support_idx = np.where(a > 0)[0] 
-
-        X_sv = self.X[self.support_idx]
-        y_sv = y[self.support_idx]
-        a_sv = a[self.support_idx]
-
-        self.b = HardMarginSVC.compute_b(X_sv, y_sv, a_sv)
-        self.w = HardMarginSVC.compute_weights(self.p, X_sv, y_sv, a_sv)
+        return minimize(loss, a0, jac=jac, constraints=constraints, method='SLSQP', options={}).x
+
+    def _fit_qp(self, X, y):
+        # hands the dual to cvxopt's native interior-point QP solver in a
+        # single call, instead of the many Python callbacks SLSQP makes
+        # cvxopt is an optional dependency, only needed for method='qp'
+        try:
+            from cvxopt import matrix, solvers
+        except ImportError:
+            raise ImportError("method='qp' requires the optional cvxopt package")
+
+        K = X @ X.T
+        Q = np.ascontiguousarray((y[:, None] * y[None, :]) * K, dtype=np.float64)
+        n = self.n
+
+        # min 0.5 a^T Q a - 1^T a  s.t.  y^T a = 0, 0 <= a (<= C)
+        P = matrix(Q)
+        q = matrix(-np.ones(n))
+        if self.C == inf:
+            G = matrix(-np.eye(n))
+            h = matrix(np.zeros(n))
+        else:
+            G = matrix(np.vstack([-np.eye(n), np.eye(n)]))
+            h = matrix(np.hstack([np.zeros(n), np.full(n, self.C)]))
+        A = matrix(y, (1, n))
+        b = matrix(0.0)
+
+        sol = solvers.qp(P, q, G, h, A, b, options={'show_progress': False})
+
+        return np.array(sol['x']).ravel()
+
+    def _fit_smo(self, X, y, C=inf, tol=1e-3, max_passes=5):
+        # Platt's sequential minimal optimization: optimizes one pair of
+        # dual variables analytically at a time, so the n x n Gram matrix is
+        # never materialized. For the linear kernel the weight vector w is
+        # maintained incrementally, making every error lookup O(p).
+        n, p = X.shape
+        a = np.zeros(n)
+        w = np.zeros(p)
+        b = 0.0
+
+        passes = 0
+        while passes < max_passes:
+            num_changed = 0
+            E = X @ w + b - y # error cache, refreshed after every update
+
+            for i in range(n):
+                # pick i violating the KKT conditions
+                if not ((y[i] * E[i] < -tol and a[i] < C) or
+                        (y[i] * E[i] > tol and a[i] > 0)):
+                    continue
+
+                # second-choice heuristic: j with the largest |E_i - E_j|
+                j = int(np.argmax(np.abs(E - E[i])))
+                if j == i:
+                    continue
+
+                # clipping bounds keeping 0 <= a <= C and the constraint a @ y == 0
+                if y[i] != y[j]:
+                    L, H = max(0, a[j] - a[i]), min(C, C + a[j] - a[i])
+                else:
+                    L, H = max(0, a[i] + a[j] - C), min(C, a[i] + a[j])
+                if L == H:
+                    continue
+
+                k_ii, k_jj, k_ij = X[i] @ X[i], X[j] @ X[j], X[i] @ X[j]
+                eta = k_ii + k_jj - 2 * k_ij # second derivative of the dual along the pair
+                if eta <= 0:
+                    continue
+
+                a_j = np.clip(a[j] + y[j] * (E[i] - E[j]) / eta, L, H)
+                if abs(a_j - a[j]) < 1e-8:
+                    continue
+                a_i = a[i] + y[i] * y[j] * (a[j] - a_j)
+
+                # update threshold b from whichever variable stays in the interior
+                b1 = b - E[i] - y[i] * (a_i - a[i]) * k_ii - y[j] * (a_j - a[j]) * k_ij
+                b2 = b - E[j] - y[i] * (a_i - a[i]) * k_ij - y[j] * (a_j - a[j]) * k_jj
+                if 0 < a_i < C:
+                    b = b1
+                elif 0 < a_j < C:
+                    b = b2
+                else:
+                    b = (b1 + b2) / 2
+
+                w += y[i] * (a_i - a[i]) * X[i] + y[j] * (a_j - a[j]) * X[j]
+                a[i], a[j] = a_i, a_j
+                E = X @ w + b - y
+                num_changed += 1
+
+            passes = passes + 1 if num_changed == 0 else 0
+
+        return a, b
 
     def predict(self, X):
         return np.where(self.predict_val(X)>0, self.map_orig[1], self.map_orig[-1])  
@@ -107,22 +212,13 @@ class HardMarginSVC(BaseClassifier):
 
     # compute model params
     @staticmethod
-    def compute_weights(p, X_sv, y_sv, a_sv):
-        w = np.zeros(p)
-        N = len(a_sv)
-        for i in range(N):
-            w += a_sv[i] * y_sv[i] * X_sv[i]
-        return w
+    def compute_weights(X_sv, y_sv, a_sv):
+        return (a_sv * y_sv) @ X_sv
 
     @staticmethod
     def compute_b(X_sv, y_sv, a_sv):
         # input only consist of support vectors (X: support vector features, y: support vector labels, a: ...)
-        N = len(a_sv)
-        b = 0
-        for i in range(N):
-            b += y_sv[i]
-            b -= np.sum(a_sv * y_sv * (X_sv @ X_sv[i]))
-        return b / N
+        return (y_sv - (a_sv * y_sv) @ (X_sv @ X_sv.T)).mean()
 
     def __len__(self):
         return self.n
@@ -1,6 +1,36 @@
 import numpy as np
-from .._base import BaseClassifier
 
-class SoftMarginSVC(BaseClassifier):
-    def __init__(self):
-        raise NotImplementedError('{self} not implemented yet.')
+from ._hard_margin_svc import HardMarginSVC
+
+class SoftMarginSVC(HardMarginSVC):
+    """
+    The Soft Margin SVC (also: Support Vector Classifier) relaxes the Hard Margin SVC
+    by allowing observations to violate the margin, controlled through the
+    regularisation parameter C. Smaller C permits more violations and yields a wider,
+    better-generalising margin; as C grows towards infinity the classifier approaches
+    the Hard Margin SVC.
+    The dual problem is identical to the hard margin dual except for the upper bound
+    0 <= alpha <= C on the dual variables, so fitting is inherited from HardMarginSVC
+    and solved with SMO.
+
+    All data specific attributes are intialised to 'None'
+    and updated on call of .fit(). Transfer Training is not supported -
+    a second call to .fit() will fully retrain the model.
+
+    Attributes:
+    ---
+    n | int                 : Number of observed datapoints in training set
+    p | int                 : Number of features in training set
+    X | np.array(n,p)       : 2D-Array of feature matrix
+    Y | np.array(n,)        : 1D-Array of target vector
+    C | float               : Regularisation parameter bounding the dual variables
+
+    Methods:
+    ---
+    .fit(X, y)              : Trains model given training split
+    .predict(X)             : Prediction from trained KNN model
+    """
+
+    def __init__(self, C=1.0):
+        super().__init__(method='smo')
+        self.C = C
@@ -2,7 +2,8 @@ import math
 import numpy as np 
 
 from ._node import Node
-from ..utils import * 
+from ._fast_split import partition, best_split_classification, best_split_mse
+from ..utils import *
 
 class DecisionTree:
     """
@@ -21,6 +22,7 @@ class DecisionTree:
         self.num_leaf_nodes = 0
 
         self.criterion = None
+        self._criterion_id = None # set by subclasses for the jitted best-split sweeps
         self.max_features = max_features # the number of features to search for in best split (if None: entire feature space)
         self.algorithm = algorithm
 
@@ -48,29 +50,76 @@ class DecisionTree:
         elif self.max_features == 'log2':
             self.max_features = int(np.ceil(np.log2(self.p)))
 
+        # presort every feature column once; _best_split re-derives the sorted
+        # order of any node from this in linear time instead of re-sorting
+        if self._criterion_id is not None:
+            self._Xf = np.ascontiguousarray(self.X, dtype=np.float64)
+            self._sorted_idx = np.argsort(self._Xf, axis=0)
+            if self._criterion_id == 2:
+                self._yf = np.asarray(self.y, dtype=np.float64)
+            else:
+                classes, codes = np.unique(self.y, return_inverse=True)
+                self._k = len(classes)
+                self._y_codes = codes.astype(np.int64)
+
         # root node
         self.root = Node(size=self.n, values=np.arange(self.n), depth=1, _type='root')
         self.num_nodes += 1
 
         self._split(self.root)
+        self._compile_tree()
         self.fitted = True
 
+    def _compile_tree(self):
+        # flattens the fitted tree into parallel arrays (BFS order, as in __str__)
+        # so predict can descend all samples in lockstep instead of walking
+        # node objects per sample
+        q = [self.root]
+        nodes = []
+        while q != []:
+            node = q.pop()
+            nodes.append(node)
+            if node.left != None:
+                q.insert(0, node.left)
+            if node.right != None:
+                q.insert(0, node.right)
+
+        index = {id(node): i for i, node in enumerate(nodes)}
+        m = len(nodes)
+
+        self._feat = np.zeros(m, dtype=np.int32)
+        self._thr = np.zeros(m)
+        self._left = np.full(m, -1, dtype=np.int32) # -1 marks a leaf
+        self._right = np.full(m, -1, dtype=np.int32)
+
+        vals = [0] * m
+        for i, node in enumerate(nodes):
+            if node.is_leaf():
+                vals[i] = node.prediction
+            else:
+                self._feat[i] = node.p
+                self._thr[i] = node.val
+                self._left[i] = index[id(node.left)]
+                self._right[i] = index[id(node.right)]
+
+        self._val = np.array(vals)
+
     def predict(self, X):
         X = validate_feature_matrix(X)
-        n = X.shape[0]
 
-        preds = np.empty(n) 
-        for i in range(n):
-            curr = self.root
-            while not curr.is_leaf():
-                if curr.decision(X[i]) == True:
-                    curr = curr.right
-                else: 
-                    curr = curr.left
+        # lockstep traversal: every sample carries its current node index and
+        # takes one step per iteration until all samples sit in a leaf
+        node = np.zeros(X.shape[0], dtype=np.int32)
+        while True:
+            active = np.nonzero(self._left[node] != -1)[0]
+            if active.size == 0:
+                break
 
-            preds[i] = curr.prediction
+            curr = node[active]
+            go_right = X[active, self._feat[curr]] < self._thr[curr] # Node.decision
+            node[active] = np.where(go_right, self._right[curr], self._left[curr])
 
-        return preds
+        return self._val[node]
 
     def predict_proba(self, X):
         # undefined for single decision tree
@@ -118,12 +167,37 @@ class DecisionTree:
                 #max_leaf_nodes_not_reached and 
                 can_split)
 
-    def _best_split(self, X, y):
+    def _best_split(self, X, y, values=None):
         if self.algorithm == 'greedy':
-            loss = math.inf 
-            best_pair = None 
+            loss = math.inf
+            best_pair = None
             feature_space = np.random.choice(list(range(self.p)), size=self.max_features, replace=False)
 
+            # fast path: criterion-specific (jitted) sweep over each candidate feature
+            if self._criterion_id is not None and values is not None:
+                # membership bitmap of the node; filtering the presorted column
+                # order through it yields the node's samples already sorted
+                in_node = np.zeros(self.n, dtype=bool)
+                in_node[values] = True
+
+                for p in feature_space:
+                    order = self._sorted_idx[:, p]
+                    ordered = order[in_node[order]]
+
+                    sc = np.ascontiguousarray(self._Xf[ordered, p])
+                    if self._criterion_id == 2:
+                        l, val = best_split_mse(sc, self._yf[ordered], self.n)
+                    else:
+                        l, val = best_split_classification(sc, self._y_codes[ordered],
+                                                           self._k, self.n, self._criterion_id)
+
+                    if not math.isnan(val) and l < loss:
+                        loss = l
+                        best_pair = (p, val)
+
+                return loss, best_pair
+
+            # generic fallback for custom criterion functions
             for p in feature_space:
                 sorted_vals = sorted(list(set(X[:, p])))
                 splits = [(sorted_vals[i]+sorted_vals[i+1]) / 2 for i in range(len(sorted_vals)-1)]
@@ -171,56 +245,52 @@ class DecisionTree:
 
 
 
-    def _split(self, curr):
-        # curr is initialised as node with size, indices of values and depth
-        # find best split
-        X, y = self.X[curr.values], self.y[curr.values] # consider training samples that are in split of current node
-
-        loss, best_pair = self._best_split(X, y) # find best pair to split further
-
-        # assign loss and split criterion
-        p, val = best_pair
-        curr.loss = loss
-        curr.p = p 
-        curr.val = val
-
-        # compute new split
-        train_decisions = []
-        for x in X:
-            train_decisions.append(curr.decision(x))
-        train_decisions = np.array(train_decisions)
-
-        curr.split = [curr.size - sum(train_decisions), sum(train_decisions)]
-
-        # find new indices in splits
-        next_values = [[], []]
-        for i in curr.values:
-            if curr.decision(self.X[i]) == 0:
-                next_values[0].append(i)
-            else:
-                next_values[1].append(i)
-
-        #next_values = [np.array(next_values[0]), np.array(next_values[1])]
-
-        # initialise new nodes
-        curr.left = Node(size=curr.split[0], values=next_values[0], depth=curr.depth+1)
-        self.num_nodes += 1
-
-        # split further if not pure or pre-pruning stop criterion not reached
-        if not self._is_pure(curr.left) and self._check_criterion(curr.left):
-            self._split(curr.left)
-        else:
-            # otherwise make leaf
-            curr.left.type = 'leaf'
-            curr.left.prediction = self._evaluate_leaf(curr.left)
-            self.num_leaf_nodes += 1
-
-        curr.right = Node(size=curr.split[1], values=next_values[1], depth=curr.depth+1)
-        self.num_nodes += 1
-
-        if not self._is_pure(curr.right) and self._check_criterion(curr.right):
-            self._split(curr.right)
-        else:
-            curr.right.type = 'leaf'
-            curr.right.prediction = self._evaluate_leaf(curr.right)
-            self.num_leaf_nodes += 1
+    def _split(self, root):
+        # explicit work stack instead of recursion (the same node-queue idea
+        # as in __str__), so deep trees never hit Python's recursion limit
+        # and pay no per-node call frame
+        stack = [root]
+
+        while stack != []:
+            curr = stack.pop()
+
+            # consider training samples that are in split of current node
+            X, y = self.X[curr.values], self.y[curr.values]
+
+            loss, best_pair = self._best_split(X, y, curr.values) # find best pair to split further
+
+            # no valid threshold among the sampled features: make curr a leaf
+            # instead of paying for another best-split scan (or crashing)
+            if best_pair is None:
+                curr.type = 'leaf'
+                curr.prediction = self._evaluate_leaf(curr)
+                self.num_leaf_nodes += 1
+                continue
+
+            # assign loss and split criterion
+            p, val = best_pair
+            curr.loss = loss
+            curr.p = p
+            curr.val = val
+
+            # partition the node indices on the decision in one vectorized pass
+            values = np.asarray(curr.values, dtype=np.int64)
+            col = np.ascontiguousarray(self.X[values, p], dtype=np.float64)
+            left_values, right_values = partition(values, col, val)
+
+            curr.split = [left_values.size, right_values.size]
+
+            # initialise new nodes
+            curr.left = Node(size=curr.split[0], values=left_values, depth=curr.depth+1)
+            curr.right = Node(size=curr.split[1], values=right_values, depth=curr.depth+1)
+            self.num_nodes += 2
+
+            # split children further if not pure and pre-pruning stop criterion not reached
+            for child in (curr.left, curr.right):
+                if not self._is_pure(child) and self._check_criterion(child):
+                    stack.append(child)
+                else:
+                    # otherwise make leaf
+                    child.type = 'leaf'
+                    child.prediction = self._evaluate_leaf(child)
+                    self.num_leaf_nodes += 1
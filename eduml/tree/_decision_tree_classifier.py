@@ -6,18 +6,23 @@ from ._decision_tree import DecisionTree
 from ..metrics import binary_gini, gini, entropy
 from .._base import BaseClassifier
 
-class DecisionTreeClassifier(BaseClassifier, DecisionTree):
+class DecisionTreeClassifier(DecisionTree, BaseClassifier):
     def __init__(self, criterion='gini', max_depth=None, algorithm='greedy', max_features='auto'):
 
-        super().__init__(max_depth=max_depth, algorithm=algorithm, max_features=max_features)
+        # both parents need explicit initialisation (BaseClassifier takes no arguments)
+        BaseClassifier.__init__(self)
+        DecisionTree.__init__(self, max_depth=max_depth, algorithm=algorithm, max_features=max_features)
 
         if criterion == 'gini':
             self.criterion = gini
+            self._criterion_id = 0
         elif criterion == 'binary_gini':
             self.criterion = binary_gini
+            self._criterion_id = 0 # binary gini equals gini on two classes
         elif criterion == 'entropy':
             self.criterion = entropy
-        else: 
+            self._criterion_id = 1
+        else:
             raise Exception('Cannot find this criterion')
 
     def _evaluate_leaf(self, node):
@@ -5,17 +5,20 @@ from ._decision_tree import DecisionTree
 from ..metrics import mse_split
 from .._base import BaseRegressor
 
-class DecisionTreeRegressor(BaseRegressor, DecisionTree):
-    def __init__(self, criterion='mse', 
+class DecisionTreeRegressor(DecisionTree, BaseRegressor):
+    def __init__(self, criterion='mse',
                  max_depth=None,
                  algorithm='greedy',
-                 k=None):
+                 max_features='auto'):
 
-        super().__init__(max_depth=max_depth, algorithm=algorithm, k=k)
+        # both parents need explicit initialisation (BaseRegressor takes no arguments)
+        BaseRegressor.__init__(self)
+        DecisionTree.__init__(self, max_depth=max_depth, algorithm=algorithm, max_features=max_features)
 
         if criterion == 'mse':
-            self.criterion = mse_split 
-        else: 
+            self.criterion = mse_split
+            self._criterion_id = 2
+        else:
             raise Exception('Cannot find this criterion')
 
     def _evaluate_leaf(self, node):
@@ -0,0 +1,122 @@
+# numba-accelerated inner loops of decision tree fitting. All functions only
+# operate on raw arrays so they can be JIT compiled; if numba is not
+# installed they run as plain Python/NumPy.
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        # no-op replacement decorator
+        def decorator(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return decorator
+
+
+@njit(cache=True)
+def partition(idx, col, val):
+    # splits the node indices on the decision col < val
+    # returns (left, right) where right holds the samples passing the decision
+    mask = col < val
+    return idx[~mask], idx[mask]
+
+
+@njit(cache=True)
+def best_split_classification(sc, sy, k, n_total, criterion_id):
+    # O(n) sweep over the candidate thresholds of one feature column,
+    # maintaining running class counts so every boundary costs O(k)
+    # expects sc (feature values) and sy (class codes) already sorted by sc;
+    # the tree presorts every column once in fit, so no sort happens here
+    # criterion_id: 0 == gini, 1 == entropy
+    n = sc.shape[0]
+
+    left = np.zeros(k)
+    right = np.zeros(k)
+    for i in range(n):
+        right[sy[i]] += 1.0
+
+    best_loss = np.inf
+    best_val = np.nan
+    nl = 0.0
+    nr = float(n)
+
+    for i in range(n - 1):
+        left[sy[i]] += 1.0
+        right[sy[i]] -= 1.0
+        nl += 1.0
+        nr -= 1.0
+
+        # only boundaries between distinct values are valid thresholds
+        if sc[i] == sc[i + 1]:
+            continue
+
+        if criterion_id == 0:
+            il = 1.0
+            ir = 1.0
+            for j in range(k):
+                pl = left[j] / nl
+                pr = right[j] / nr
+                il -= pl * pl
+                ir -= pr * pr
+        else:
+            il = 0.0
+            ir = 0.0
+            for j in range(k):
+                if left[j] > 0.0:
+                    pl = left[j] / nl
+                    il -= pl * np.log(pl)
+                if right[j] > 0.0:
+                    pr = right[j] / nr
+                    ir -= pr * np.log(pr)
+
+        loss = (il * nl + ir * nr) / n_total
+        if loss < best_loss:
+            best_loss = loss
+            best_val = (sc[i] + sc[i + 1]) / 2
+
+    return best_loss, best_val
+
+
+@njit(cache=True)
+def best_split_mse(sc, sy, n_total):
+    # same sweep for regression: running sum and sum of squares give the
+    # squared error of both sides in O(1) per boundary
+    # expects sc and sy already sorted by sc
+    n = sc.shape[0]
+
+    sum_r = 0.0
+    sq_r = 0.0
+    for i in range(n):
+        sum_r += sy[i]
+        sq_r += sy[i] * sy[i]
+    sum_l = 0.0
+    sq_l = 0.0
+
+    best_loss = np.inf
+    best_val = np.nan
+    nl = 0.0
+    nr = float(n)
+
+    for i in range(n - 1):
+        v = sy[i]
+        sum_l += v
+        sq_l += v * v
+        sum_r -= v
+        sq_r -= v * v
+        nl += 1.0
+        nr -= 1.0
+
+        if sc[i] == sc[i + 1]:
+            continue
+
+        sse_l = sq_l - sum_l * sum_l / nl
+        sse_r = sq_r - sum_r * sum_r / nr
+
+        loss = (sse_l * nl + sse_r * nr) / n_total
+        if loss < best_loss:
+            best_loss = loss
+            best_val = (sc[i] + sc[i + 1]) / 2
+
+    return best_loss, best_val
@@ -0,0 +1,7 @@
+# helper to run independent jobs across worker threads
+from concurrent.futures import ThreadPoolExecutor
+
+def run_parallel(func, jobs, max_workers=None):
+    # runs func on every element of jobs and returns the results in order
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, jobs))